@@ -1,5 +1,6 @@
 """PyNaCl implementation of EncryptionProtocol."""
 
+from nacl.bindings import crypto_secretbox_easy, crypto_secretbox_open_easy
 from nacl.secret import SecretBox
 from nacl.utils import random
 
@@ -18,15 +19,23 @@ class PyNaClEncryptionAdapter:
     def encrypt(self, key: bytes, plaintext: bytes) -> bytes:
         """Encrypt data with the given key.
 
-        Returns ciphertext with prepended nonce (24 bytes).
+        Returns ciphertext with prepended nonce (24 bytes). Calls the
+        secretbox binding directly: SecretBox.encrypt copies its output
+        into an EncryptedMessage, which would then be copied again into
+        plain bytes.
         """
-        box = SecretBox(key)
-        return bytes(box.encrypt(plaintext))
+        nonce: bytes = random(SecretBox.NONCE_SIZE)
+        return nonce + crypto_secretbox_easy(plaintext, nonce, key)
 
     def decrypt(self, key: bytes, ciphertext: bytes) -> bytes:
         """Decrypt data with the given key.
 
-        Expects ciphertext with prepended nonce (24 bytes).
+        Expects ciphertext with prepended nonce (24 bytes). Like encrypt,
+        this skips building a SecretBox per call; keys are per-document,
+        so there is no box worth caching.
         """
-        box = SecretBox(key)
-        return bytes(box.decrypt(ciphertext))
+        nonce = ciphertext[: SecretBox.NONCE_SIZE]
+        plaintext: bytes = crypto_secretbox_open_easy(
+            ciphertext[SecretBox.NONCE_SIZE :], nonce, key
+        )
+        return plaintext
@@ -41,4 +41,8 @@ class StorageService:
         Returns:
             SHA256 hash of data + seed.
         """
-        return hashlib.sha256(data + seed).digest()
+        # Feed the parts separately rather than hashing data + seed, which
+        # would copy the whole blob just to append the seed.
+        digest = hashlib.sha256(data)
+        digest.update(seed)
+        return digest.digest()
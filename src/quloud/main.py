@@ -3,9 +3,11 @@
 Wires up all components and runs the message consumers.
 """
 
+import hashlib
 import logging
 import os
 import signal
+import ssl
 import threading
 import uuid
 from collections.abc import Callable
@@ -208,6 +210,10 @@ def main() -> None:
 
     logger.info("Starting Quloud node: %s", node_id)
     logger.info("Storage directory: %s", storage_dir)
+    # openssl_sha256 means proofs use OpenSSL, which picks SHA-NI / ARMv8 SHA2
+    logger.info(
+        "Proof hash backend: %s (%s)", hashlib.sha256.__name__, ssl.OPENSSL_VERSION
+    )
 
     handle = start_node(
         make_connection=create_rabbitmq_connection,
@@ -1,5 +1,10 @@
 """Client for owner-initiated network operations."""
 
+import time
+from collections.abc import Callable
+from types import TracebackType
+from typing import Self
+
 from synapse.protocols.publisher import PubSubPublisher
 
 from quloud.core.encryption_service import EncryptionService
@@ -19,6 +24,18 @@ class NodeClient:
 
     Used by node owners to store, retrieve, and verify data.
     The local node always stores data; replicas are additional remote copies.
+
+    With a non-zero coalesce_window, replica store requests are buffered per
+    blob and sent together once the window has elapsed (checked on the next
+    store) or on flush(). Store requests still buffered when the blob is
+    deleted are dropped, so short-lived blobs never ship their data to the
+    network. Any other operation on a blob first sends that blob's buffered
+    stores, then publishes immediately.
+
+    There is no background timer, so an idle coalescing client holds its
+    buffer indefinitely. Callers that enable coalescing must call close()
+    (or use the client as a context manager) before going idle or shutting
+    down, otherwise buffered replica requests are never sent.
     """
 
     def __init__(
@@ -31,6 +48,8 @@ class NodeClient:
         retrieve_topic: str,
         proof_topic: str,
         delete_topic: str,
+        coalesce_window: float = 0.0,
+        clock: Callable[[], float] = time.monotonic,
     ) -> None:
         """Initialize the client.
 
@@ -43,6 +62,9 @@ class NodeClient:
             retrieve_topic: Topic for RetrieveRequest messages.
             proof_topic: Topic for ProofOfStorageRequest messages.
             delete_topic: Topic for DeleteRequest messages.
+            coalesce_window: Seconds to buffer publishes before sending
+                (default 0 = publish immediately).
+            clock: Monotonic time source for the coalesce window.
         """
         self._storage = storage
         self._encryption = encryption
@@ -52,6 +74,56 @@ class NodeClient:
         self._retrieve_topic = retrieve_topic
         self._proof_topic = proof_topic
         self._delete_topic = delete_topic
+        self._coalesce_window = coalesce_window
+        self._clock = clock
+        self._pending: dict[str, list[bytes]] = {}
+        self._window_start: float | None = None
+
+    def _publish_store(self, blob_id: str, payload: bytes) -> None:
+        """Publish a store request now, or buffer it if coalescing is enabled."""
+        if self._coalesce_window <= 0:
+            self._publisher.publish(self._store_topic, payload)
+            return
+
+        self._pending.setdefault(blob_id, []).append(payload)
+        now = self._clock()
+        if self._window_start is None:
+            self._window_start = now
+        elif now - self._window_start >= self._coalesce_window:
+            self.flush()
+
+    def _flush_blob(self, blob_id: str) -> None:
+        """Publish buffered store requests for one blob.
+
+        Each payload leaves the buffer only after it is published, so a
+        failed publish keeps it and everything after it for the next flush.
+        """
+        payloads = self._pending.get(blob_id)
+        while payloads:
+            self._publisher.publish(self._store_topic, payloads[0])
+            payloads.pop(0)
+        self._pending.pop(blob_id, None)
+
+    def flush(self) -> None:
+        """Publish all buffered store requests, preserving per-blob order."""
+        while self._pending:
+            self._flush_blob(next(iter(self._pending)))
+        self._window_start = None
+
+    def close(self) -> None:
+        """Send any buffered messages. Required when coalescing is enabled."""
+        self.flush()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self.close()
 
     def store_blob(self, blob_id: str, data: bytes, replicas: int = 0) -> None:
         """Store data locally and optionally replicate to remote nodes.
@@ -69,10 +141,9 @@ class NodeClient:
         # Request remote replicas if any
         if replicas > 0:
             request = StoreRequestMessage(blob_id=blob_id, data=encrypted)
+            payload = request.model_dump_json().encode()
             for _ in range(replicas):
-                self._publisher.publish(
-                    self._store_topic, request.model_dump_json().encode()
-                )
+                self._publish_store(blob_id, payload)
 
     def retrieve_blob(self, blob_id: str) -> RetrieveResponseMessage:
         """Retrieve a blob from local storage.
@@ -104,6 +175,7 @@ class NodeClient:
         Args:
             blob_id: Unique identifier for the blob to restore.
         """
+        self._flush_blob(blob_id)
         request = RetrieveRequestMessage(blob_id=blob_id)
         self._publisher.publish(
             self._retrieve_topic, request.model_dump_json().encode()
@@ -116,6 +188,7 @@ class NodeClient:
             blob_id: Unique identifier for the blob to verify.
             seed: Random seed for replay protection.
         """
+        self._flush_blob(blob_id)
         request = ProofRequestMessage(blob_id=blob_id, seed=seed)
         self._publisher.publish(self._proof_topic, request.model_dump_json().encode())
 
@@ -125,10 +198,14 @@ class NodeClient:
         Shreds the local encryption key, deletes the local blob data,
         and publishes a DeleteRequest for remote nodes to do the same.
 
+        Buffered store requests for the blob are discarded. The delete is
+        still published, since earlier copies may already be on the network.
+
         Args:
             blob_id: Unique identifier for the blob to delete.
         """
         self._key_store.delete_key(blob_id)
         self._storage.delete(blob_id)
+        self._pending.pop(blob_id, None)
         request = DeleteRequestMessage(blob_id=blob_id)
         self._publisher.publish(self._delete_topic, request.model_dump_json().encode())
@@ -2,6 +2,7 @@
 
 import logging
 
+from pydantic_core import to_json
 from synapse.protocols.publisher import PubSubPublisher
 
 from quloud.core.encryption_service import EncryptionService
@@ -44,6 +45,21 @@ class StoreRequestHandler:
         self._node_id = node_id
         self._response_topic = response_topic
 
+        # Successful responses differ only in blob_id, so serialize the rest
+        # once around a placeholder and splice each blob_id into that slot.
+        placeholder = "\0blob_id\0"
+        template = (
+            StoreResponseMessage(blob_id=placeholder, node_id=node_id, stored=True)
+            .model_dump_json()
+            .encode()
+        )
+        parts = template.split(to_json(placeholder))
+        if len(parts) != 2 or not parts[0].endswith(b'"blob_id":'):
+            raise RuntimeError(
+                "StoreResponseMessage layout does not allow splicing blob_id"
+            )
+        self._response_prefix, self._response_suffix = parts
+
     def handle(self, request: StoreRequestMessage) -> None:
         """Handle a StoreRequest.
 
@@ -58,12 +74,8 @@ class StoreRequestHandler:
         self._storage.store(request.blob_id, encrypted_data)
         self._key_store.store_key(request.blob_id, key)
         logger.info("Stored blob_id=%s", request.blob_id)
-        response = StoreResponseMessage(
-            blob_id=request.blob_id,
-            node_id=self._node_id,
-            stored=True,
-        )
-        self._publisher.publish(
-            self._response_topic, response.model_dump_json().encode()
+        response = (
+            self._response_prefix + to_json(request.blob_id) + self._response_suffix
         )
+        self._publisher.publish(self._response_topic, response)
         logger.info("Store response published for blob_id=%s", request.blob_id)
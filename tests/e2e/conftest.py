@@ -177,6 +177,8 @@ def owner_client(replica_node, storage_dir):
 class ResponseCapture:
     """Captures a single response message via threading.Event."""
 
+    __slots__ = ("_event", "_response")
+
     def __init__(self) -> None:
         self._event = threading.Event()
         self._response: object = None
@@ -220,6 +222,8 @@ def proof_capture(replica_node):
 class StoreResponseHandler:
     """Handles StoreResponse messages via callback."""
 
+    __slots__ = ("_on_response",)
+
     def __init__(self, on_response):
         self._on_response = on_response
 
@@ -252,6 +256,8 @@ def store_capture(replica_node):
 class RetrieveResponseHandler:
     """Handles RetrieveResponse messages via callback."""
 
+    __slots__ = ("_on_response",)
+
     def __init__(self, on_response):
         self._on_response = on_response
 
@@ -37,7 +37,9 @@ def test_blob_lifecycle(
     assert proof_response.found is True
     assert proof_response.blob_id == blob_id
 
-    expected_proof = hashlib.sha256(e_owner + seed).digest()
+    expected = hashlib.sha256(e_owner)
+    expected.update(seed)
+    expected_proof = expected.digest()
     assert proof_response.proof == expected_proof
 
     # 4. Simulate local data loss — blob gone, key intact
@@ -9,6 +9,7 @@ from __future__ import annotations
 
 import hashlib
 import os
+import time
 from collections import defaultdict
 from pathlib import Path
 from typing import Any
@@ -81,6 +82,8 @@ class PurePythonEncryptionAdapter:
 class _InMemoryPublisher:
     """Publisher that satisfies PubSubPublisher by routing through the bus."""
 
+    __slots__ = ("_bus",)
+
     def __init__(self, bus: InMemoryBus) -> None:
         self._bus = bus
 
@@ -88,6 +91,22 @@ class _InMemoryPublisher:
         self._bus._on_publish(topic, data)
 
 
+class _FailOncePublisher:
+    """Publisher whose first publish raises, then routes through the bus."""
+
+    __slots__ = ("_inner", "_failed")
+
+    def __init__(self, inner: _InMemoryPublisher) -> None:
+        self._inner = inner
+        self._failed = False
+
+    def publish(self, topic: str, data: bytes, **kwargs: Any) -> None:
+        if not self._failed:
+            self._failed = True
+            raise ConnectionError("simulated broker outage")
+        self._inner.publish(topic, data, **kwargs)
+
+
 class InMemoryBus:
     """Synchronous in-process message bus.
 
@@ -95,6 +114,8 @@ class InMemoryBus:
     no state to corrupt across fork boundaries.
     """
 
+    __slots__ = ("_handlers", "_responses")
+
     def __init__(self) -> None:
         self._handlers: dict[str, tuple[object, type[BaseModel]]] = {}
         self._responses: dict[str, list[bytes]] = defaultdict(list)
@@ -144,6 +165,17 @@ class InMemoryBus:
         data = self._responses[topic].pop(0)
         return model.model_validate_json(data)
 
+    def pending(self, topic: str) -> list[bytes]:
+        """Return the raw captured responses for a topic without consuming them.
+
+        Args:
+            topic: The response topic to read from.
+
+        Returns:
+            Copy of the captured payloads, oldest first.
+        """
+        return list(self._responses[topic])
+
 
 # ============================================================================
 # Fixtures — all function-scoped, fork-safe
@@ -223,8 +255,13 @@ def replica_node(bus: InMemoryBus, replica_storage_dir: Path) -> None:
     bus.subscribe("quloud.delete.requests", delete_handler, DeleteRequestMessage)
 
 
-@pytest.fixture()
-def owner_client(bus: InMemoryBus, replica_node: None, storage_dir: Path) -> NodeClient:
+def _make_owner_client(
+    bus: InMemoryBus,
+    storage_dir: Path,
+    coalesce_window: float = 0.0,
+    clock: FakeClock | None = None,
+    publisher: _InMemoryPublisher | _FailOncePublisher | None = None,
+) -> NodeClient:
     """Owner's NodeClient with real services and bus publisher."""
     storage_service = StorageService(
         storage=FilesystemStorageAdapter(base_dir=storage_dir)
@@ -238,11 +275,59 @@ def owner_client(bus: InMemoryBus, replica_node: None, storage_dir: Path) -> Nod
         storage=storage_service,
         encryption=encryption_service,
         key_store=key_store_service,
-        publisher=bus.publisher(),
+        publisher=publisher or bus.publisher(),
         store_topic="quloud.store.requests",
         retrieve_topic="quloud.retrieve.requests",
         proof_topic="quloud.proof.requests",
         delete_topic="quloud.delete.requests",
+        coalesce_window=coalesce_window,
+        clock=clock.monotonic if clock else time.monotonic,
+    )
+
+
+@pytest.fixture()
+def owner_client(bus: InMemoryBus, replica_node: None, storage_dir: Path) -> NodeClient:
+    """Owner's NodeClient with real services and bus publisher."""
+    return _make_owner_client(bus, storage_dir)
+
+
+class FakeClock:
+    """Stands in for time.monotonic so coalescing windows elapse on demand."""
+
+    __slots__ = ("now",)
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+
+@pytest.fixture()
+def clock() -> FakeClock:
+    """Fake monotonic clock injected into the coalescing NodeClient."""
+    return FakeClock()
+
+
+@pytest.fixture()
+def coalescing_client(
+    bus: InMemoryBus, replica_node: None, storage_dir: Path, clock: FakeClock
+) -> NodeClient:
+    """Owner's NodeClient with a 1 s coalesce window on a fake clock."""
+    return _make_owner_client(bus, storage_dir, coalesce_window=1.0, clock=clock)
+
+
+@pytest.fixture()
+def flaky_coalescing_client(
+    bus: InMemoryBus, replica_node: None, storage_dir: Path, clock: FakeClock
+) -> NodeClient:
+    """Coalescing NodeClient whose first publish fails."""
+    return _make_owner_client(
+        bus,
+        storage_dir,
+        coalesce_window=1.0,
+        clock=clock,
+        publisher=_FailOncePublisher(bus.publisher()),
     )
 
 
@@ -1,15 +1,23 @@
 """Fork-safe mutation tests for Quloud.
 
-Mirrors all 5 e2e test scenarios with synchronous InMemoryBus
+Mirrors the e2e test scenarios with synchronous InMemoryBus
 instead of RabbitMQ. Real encryption, real filesystem, real handlers.
 """
 
+import errno
 import hashlib
 import os
 from pathlib import Path
 
+import pytest
+
 from quloud.adapters.key_store.filesystem_adapter import FilesystemKeyStoreAdapter
-from quloud.adapters.storage.filesystem_adapter import FilesystemStorageAdapter
+from quloud.adapters.storage import filesystem_adapter
+from quloud.adapters.storage.filesystem_adapter import (
+    DIRECT_IO_THRESHOLD,
+    FilesystemStorageAdapter,
+    _write_direct,
+)
 from quloud.core.storage_service import StorageService
 from quloud.services.message_contracts import (
     ProofResponseMessage,
@@ -48,7 +56,9 @@ def test_blob_lifecycle(owner_client, bus_response, storage_dir):
     assert proof_response.found is True
     assert proof_response.blob_id == blob_id
 
-    expected_proof = hashlib.sha256(e_owner + seed).digest()
+    expected = hashlib.sha256(e_owner)
+    expected.update(seed)
+    expected_proof = expected.digest()
     assert proof_response.proof == expected_proof
 
     # 4. Simulate local data loss — blob gone, key intact
@@ -80,22 +90,33 @@ def test_retrieve_missing_blob(owner_client):
     assert response.data is None
 
 
-def test_proof_missing_blob(owner_client, bus_response):
-    """Proof request for a non-existent blob returns found=False."""
-    owner_client.request_proof("does-not-exist", os.urandom(32))
+@pytest.mark.parametrize(
+    ("send_request", "topic", "model", "payload_field"),
+    [
+        (
+            lambda client: client.request_proof("does-not-exist", os.urandom(32)),
+            "quloud.proof.responses",
+            ProofResponseMessage,
+            "proof",
+        ),
+        (
+            lambda client: client.restore_blob("does-not-exist"),
+            "quloud.retrieve.responses",
+            RetrieveResponseMessage,
+            "data",
+        ),
+    ],
+    ids=["proof", "restore"],
+)
+def test_remote_request_for_missing_blob(
+    owner_client, bus_response, send_request, topic, model, payload_field
+):
+    """Remote request for a non-existent blob returns found=False."""
+    send_request(owner_client)
 
-    response = bus_response("quloud.proof.responses", ProofResponseMessage)
+    response = bus_response(topic, model)
     assert response.found is False
-    assert response.proof is None
-
-
-def test_restore_missing_blob(owner_client, bus_response):
-    """Retrieve request for a non-existent blob on remote returns found=False."""
-    owner_client.restore_blob("does-not-exist")
-
-    response = bus_response("quloud.retrieve.responses", RetrieveResponseMessage)
-    assert response.found is False
-    assert response.data is None
+    assert getattr(response, payload_field) is None
 
 
 def test_adapter_delete_and_nested_directory_creation(tmp_path):
@@ -138,3 +159,203 @@ def test_store_uses_per_document_key(owner_client, storage_dir, tmp_path):
     key_store = FilesystemKeyStoreAdapter(base_dir=key_dir)
     key_store.store_key("nested-test", b"k" * 32)
     assert (key_dir / "nested-test.key").read_bytes() == b"k" * 32
+
+
+@pytest.fixture()
+def direct_io_dir(tmp_path):
+    """tmp_path, skipping the test if its filesystem rejects O_DIRECT."""
+    if not hasattr(os, "O_DIRECT"):
+        pytest.skip("platform has no O_DIRECT")
+    probe = tmp_path / "probe"
+    try:
+        fd = os.open(probe, os.O_WRONLY | os.O_CREAT | os.O_DIRECT)
+    except OSError as e:
+        if e.errno == errno.EINVAL:
+            pytest.skip("filesystem rejects O_DIRECT")
+        raise
+    os.close(fd)
+    probe.unlink()
+    return tmp_path
+
+
+def _default_file_mode() -> int:
+    """Permission bits a new 0o666 file gets under the current umask."""
+    umask = os.umask(0)
+    os.umask(umask)
+    return 0o666 & ~umask
+
+
+def test_direct_write_truncates_padding(direct_io_dir):
+    """O_DIRECT writes page-padded, then truncates back to the exact size."""
+    path = direct_io_dir / "direct.blob"
+    data = os.urandom(DIRECT_IO_THRESHOLD + 123)
+
+    assert _write_direct(path, data) is True
+    assert path.read_bytes() == data
+    assert path.stat().st_mode & 0o777 == _default_file_mode()
+
+
+def test_direct_write_rejects_short_write(direct_io_dir, monkeypatch):
+    """A short O_DIRECT write is reported as unsupported, not as success."""
+    monkeypatch.setattr(filesystem_adapter.os, "write", lambda fd, data: 0)
+
+    assert _write_direct(direct_io_dir / "short.blob", b"x" * 10) is False
+
+
+def test_buffered_write_uses_default_file_mode(tmp_path):
+    """Small blobs are created with 0o666 less the umask, like open()."""
+    FilesystemStorageAdapter(base_dir=tmp_path).store("small", b"data")
+
+    assert (tmp_path / "small.blob").stat().st_mode & 0o777 == _default_file_mode()
+
+
+def test_direct_write_unavailable_falls_back(tmp_path, monkeypatch):
+    """Without O_DIRECT, large blobs take the buffered path with identical bytes."""
+    monkeypatch.delattr(os, "O_DIRECT", raising=False)
+    storage = FilesystemStorageAdapter(base_dir=tmp_path)
+    data = os.urandom(DIRECT_IO_THRESHOLD + 123)
+
+    assert _write_direct(tmp_path / "probe.blob", data) is False
+    storage.store("large-blob", data)
+    assert storage.retrieve("large-blob") == data
+
+
+def test_direct_io_threshold_is_inclusive(tmp_path, monkeypatch):
+    """Blobs of exactly DIRECT_IO_THRESHOLD bytes take the direct path."""
+    sizes = []
+
+    def record(path, data):
+        sizes.append(len(data))
+        return False
+
+    monkeypatch.setattr(filesystem_adapter, "_write_direct", record)
+    storage = FilesystemStorageAdapter(base_dir=tmp_path)
+    storage.store("below", b"x" * (DIRECT_IO_THRESHOLD - 1))
+    storage.store("at", b"x" * DIRECT_IO_THRESHOLD)
+
+    assert sizes == [DIRECT_IO_THRESHOLD]
+    assert storage.retrieve("at") == b"x" * DIRECT_IO_THRESHOLD
+
+
+def test_coalesced_store_then_delete_skips_replica_store(
+    coalescing_client, bus, replica_storage_dir
+):
+    """A blob deleted inside the coalesce window never ships its data."""
+    blob_id = "mut-transient"
+    with coalescing_client as client:
+        client.store_blob(blob_id, b"short-lived", replicas=2)
+        client.delete_blob(blob_id)
+
+    assert bus.pending("quloud.store.responses") == []
+    assert not (Path(replica_storage_dir) / f"{blob_id}.blob").exists()
+
+
+def test_coalesced_stores_sent_on_close(coalescing_client, bus, bus_response):
+    """Buffered store requests are held until close() sends them."""
+    coalescing_client.store_blob("mut-coalesced-a", b"kept", replicas=1)
+    coalescing_client.store_blob("mut-coalesced-b", b"also kept", replicas=1)
+    assert bus.pending("quloud.store.responses") == []
+
+    coalescing_client.close()
+
+    first = bus_response("quloud.store.responses", StoreResponseMessage)
+    second = bus_response("quloud.store.responses", StoreResponseMessage)
+    assert [first.blob_id, second.blob_id] == ["mut-coalesced-a", "mut-coalesced-b"]
+
+
+@pytest.mark.parametrize("operation", ["restore", "proof"])
+def test_coalesced_store_flushed_before_other_operation(
+    coalescing_client, bus, bus_response, operation
+):
+    """Restore and proof requests send the blob's buffered stores first."""
+    blob_id = "mut-ordered"
+    coalescing_client.store_blob(blob_id, b"ordered", replicas=1)
+    coalescing_client.store_blob("mut-bystander", b"still buffered", replicas=1)
+
+    if operation == "restore":
+        coalescing_client.restore_blob(blob_id)
+        response = bus_response("quloud.retrieve.responses", RetrieveResponseMessage)
+        assert response.found is True
+    else:
+        coalescing_client.request_proof(blob_id, b"seed")
+        response = bus_response("quloud.proof.responses", ProofResponseMessage)
+        assert response.found is True
+
+    store_response = bus_response("quloud.store.responses", StoreResponseMessage)
+    assert store_response.blob_id == blob_id
+    assert bus.pending("quloud.store.responses") == []
+
+
+def test_coalesce_window_elapsed_flushes_on_next_store(
+    coalescing_client, clock, bus, bus_response
+):
+    """Once the window has elapsed, the next store sends everything buffered."""
+    coalescing_client.store_blob("mut-window", b"windowed", replicas=1)
+    clock.now = 0.999
+    coalescing_client.store_blob("mut-window-2", b"still inside", replicas=1)
+    assert bus.pending("quloud.store.responses") == []
+
+    clock.now = 1.0
+    coalescing_client.store_blob("mut-window-3", b"past the window", replicas=1)
+
+    blob_ids = [
+        bus_response("quloud.store.responses", StoreResponseMessage).blob_id
+        for _ in range(3)
+    ]
+    assert blob_ids == ["mut-window", "mut-window-2", "mut-window-3"]
+
+
+def test_failed_flush_keeps_unsent_stores(
+    flaky_coalescing_client, clock, bus, bus_response
+):
+    """A publish failure during flush leaves unsent stores buffered for retry."""
+    flaky_coalescing_client.store_blob("mut-flaky", b"retry me", replicas=2)
+    clock.now = 1.0
+    with pytest.raises(ConnectionError):
+        flaky_coalescing_client.store_blob("mut-flaky-2", b"and me", replicas=1)
+    assert bus.pending("quloud.store.responses") == []
+
+    flaky_coalescing_client.close()
+
+    blob_ids = [
+        bus_response("quloud.store.responses", StoreResponseMessage).blob_id
+        for _ in range(3)
+    ]
+    assert blob_ids == ["mut-flaky", "mut-flaky", "mut-flaky-2"]
+    assert bus.pending("quloud.store.responses") == []
+
+
+def test_different_seeds_produce_different_proofs(
+    owner_client, bus_response, storage_dir
+):
+    """Each challenge seed yields its own proof over the same stored blob."""
+    blob_id = "mut-two-seeds"
+    owner_client.store_blob(blob_id, b"challenge me twice", replicas=1)
+    bus_response("quloud.store.responses", StoreResponseMessage)
+    e_owner = (Path(storage_dir) / f"{blob_id}.blob").read_bytes()
+
+    # Hash the shared blob prefix once, then finish per seed
+    prefix = hashlib.sha256(e_owner)
+    proofs = []
+    for seed in (b"seed-1", b"seed-2"):
+        owner_client.request_proof(blob_id, seed)
+        response = bus_response("quloud.proof.responses", ProofResponseMessage)
+        expected = prefix.copy()
+        expected.update(seed)
+        assert response.proof == expected.digest()
+        proofs.append(response.proof)
+
+    assert proofs[0] != proofs[1]
+
+
+def test_store_response_matches_contract_serialization(owner_client, bus):
+    """The spliced store response is byte-identical to the contract's JSON."""
+    blob_id = 'mut-"quoted"\\blob'
+    owner_client.store_blob(blob_id, b"template", replicas=1)
+
+    expected = StoreResponseMessage(
+        blob_id=blob_id, node_id="replica-node", stored=True
+    )
+    assert bus.pending("quloud.store.responses") == [
+        expected.model_dump_json().encode()
+    ]